@@ -522,5 +522,5 @@ def get_stoich_from_mpid(mpid):
 
         # Cache it because this stuff because querying MP takes awhile
         with open(cache_name, 'wb') as file_handle:
-            pickle.dump(stoich, file_handle)
+            pickle.dump(stoich, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
     return stoich
@@ -6,9 +6,8 @@ accidentally affect the setting in a different location.
 '''
 
 import warnings
-from collections import OrderedDict
-from ase import Atoms
-import ase.constraints
+import copy
+from functools import lru_cache
 
 
 def pp_version():
@@ -17,78 +16,90 @@ def pp_version():
 
 
 def xc_settings(xc='rpbe'):
+    '''
+    The pseudopotential (pp), generalized gradient approximation (gga), and
+    other pertinent information for a set of exchange correlationals. See
+    `_xc_settings` for the available sets. We return a copy, so feel free to
+    modify it.
+    '''
+    return dict(_xc_settings()[xc])
+
+
+@lru_cache(maxsize=1)
+def _xc_settings():
     '''
     A dictionary whose keys are some typical sets of exchange correlationals
     and whose values are dictionaries with the corresponding pseudopotential
     (pp), generalized gradient approximations (ggas), and other pertinent
     information.  Credit goes to John Kitchin who wrote vasp.Vasp.xc_defaults,
-    which we copied and put here.
+    which we copied and put here. This is cached, so do not modify its output
+    directly. Use `xc_settings` instead.
     '''
-    xc_settings = {'lda': OrderedDict(pp='LDA'),
+    xc_settings = {'lda': dict(pp='LDA'),
                     # GGAs
-                   'gga': OrderedDict(pp='GGA'),
-                   'pbe': OrderedDict(pp='PBE'),
-                   'revpbe': OrderedDict(pp='LDA', gga='RE'),
-                   'rpbe': OrderedDict(gga='RP', pp='PBE'),
-                   'am05': OrderedDict(pp='LDA', gga='AM'),
-                   'pbesol': OrderedDict(gga='PS', pp='PBE'),
+                   'gga': dict(pp='GGA'),
+                   'pbe': dict(pp='PBE'),
+                   'revpbe': dict(pp='LDA', gga='RE'),
+                   'rpbe': dict(gga='RP', pp='PBE'),
+                   'am05': dict(pp='LDA', gga='AM'),
+                   'pbesol': dict(gga='PS', pp='PBE'),
                    # Meta-GGAs
-                   'tpss': OrderedDict(pp='PBE', metagga='TPSS'),
-                   'revtpss': OrderedDict(pp='PBE', metagga='RTPSS'),
-                   'm06l': OrderedDict(pp='PBE', metagga='M06L'),
+                   'tpss': dict(pp='PBE', metagga='TPSS'),
+                   'revtpss': dict(pp='PBE', metagga='RTPSS'),
+                   'm06l': dict(pp='PBE', metagga='M06L'),
                    # vdW-DFs
-                   'optpbe_vdw': OrderedDict(pp='LDA', gga='OR', luse_vdw=True,
-                                             aggac=0.0),
-                   'optb88_vdw': OrderedDict(pp='LDA', gga='BO', luse_vdw=True,
-                                             aggac=0.0, param1=1.1 / 6.0,
-                                             param2=0.22),
-                   'optb86b_vdw': OrderedDict(pp='LDA', gga='MK',
-                                              luse_vdw=True, aggac=0.0,
-                                              param1=0.1234, param2=1.0),
-                   'vdw_df2': OrderedDict(pp='LDA', gga='ML', luse_vdw=True,
-                                          aggac=0.0, zab_vdw=-1.8867),
-                   'beef_vdw': OrderedDict(pp='PBE', gga='BF', luse_vdw=True,
-                                           zab_vdw=-1.8867, lbeefens=True),
+                   'optpbe_vdw': dict(pp='LDA', gga='OR', luse_vdw=True,
+                                      aggac=0.0),
+                   'optb88_vdw': dict(pp='LDA', gga='BO', luse_vdw=True,
+                                      aggac=0.0, param1=1.1 / 6.0,
+                                      param2=0.22),
+                   'optb86b_vdw': dict(pp='LDA', gga='MK',
+                                       luse_vdw=True, aggac=0.0,
+                                       param1=0.1234, param2=1.0),
+                   'vdw_df2': dict(pp='LDA', gga='ML', luse_vdw=True,
+                                   aggac=0.0, zab_vdw=-1.8867),
+                   'beef_vdw': dict(pp='PBE', gga='BF', luse_vdw=True,
+                                    zab_vdw=-1.8867, lbeefens=True),
                    # hybrids
-                   'pbe0': OrderedDict(pp='LDA', gga='PE', lhfcalc=True),
-                   'hse03': OrderedDict(pp='LDA', gga='PE', lhfcalc=True,
-                                        hfscreen=0.3),
-                   'hse06': OrderedDict(pp='LDA', gga='PE', lhfcalc=True,
-                                        hfscreen=0.2),
-                   'b3lyp': OrderedDict(pp='LDA', gga='B3', lhfcalc=True,
-                                        aexx=0.2, aggax=0.72, aggac=0.81,
-                                        aldac=0.19),
-                   'hf': OrderedDict(pp='PBE', lhfcalc=True, aexx=1.0,
-                                     aldac=0.0, aggac=0.0)}
-    return xc_settings[xc]
+                   'pbe0': dict(pp='LDA', gga='PE', lhfcalc=True),
+                   'hse03': dict(pp='LDA', gga='PE', lhfcalc=True,
+                                 hfscreen=0.3),
+                   'hse06': dict(pp='LDA', gga='PE', lhfcalc=True,
+                                 hfscreen=0.2),
+                   'b3lyp': dict(pp='LDA', gga='B3', lhfcalc=True,
+                                 aexx=0.2, aggax=0.72, aggac=0.81,
+                                 aldac=0.19),
+                   'hf': dict(pp='PBE', lhfcalc=True, aexx=1.0,
+                              aldac=0.0, aggac=0.0)}
+    return xc_settings
 
 
 def gas_settings():
     ''' The default settings we use to do DFT calculations of gases '''
-    gas_settings = OrderedDict(vasp=OrderedDict(ibrion=2,
-                                                nsw=100,
-                                                isif=0,
-                                                kpts=(1, 1, 1),
-                                                ediffg=-0.03,
-                                                encut=350.,
-                                                pp_version=pp_version(),
-                                                **xc_settings()))
+    gas_settings = dict(vasp=dict(ibrion=2,
+                                  nsw=100,
+                                  isif=0,
+                                  kpts=(1, 1, 1),
+                                  ediffg=-0.03,
+                                  encut=350.,
+                                  pp_version=pp_version(),
+                                  **xc_settings()))
     return gas_settings
 
 
 def bulk_settings():
     ''' The default settings we use to do DFT calculations of bulks '''
-    bulk_settings = OrderedDict(max_atoms=80,
-                                vasp=OrderedDict(ibrion=1,
-                                                 nsw=100,
-                                                 isif=7,
-                                                 isym=0,
-                                                 ediff=1e-8,
-                                                 kpts=(10, 10, 10),
-                                                 prec='Accurate',
-                                                 encut=500.,
-                                                 pp_version=pp_version(),
-                                                 **xc_settings()))
+    bulk_settings = dict(max_atoms=80,
+                         vasp=dict(ibrion=1,
+                                   nsw=100,
+                                   isif=7,
+                                   isym=0,
+                                   ediff=1e-8,
+                                   kpts=(10, 10, 10),
+                                   prec='Accurate',
+                                   encut=500.,
+                                   pp_version=pp_version(),
+                                   **xc_settings()))
     return bulk_settings
 
 
@@ -97,17 +108,17 @@ def surface_energy_bulk_settings():
     The default settings we use to do DFT calculations of bulks
     spefically for surface energy calculations.
     '''
-    SE_bulk_settings = OrderedDict(max_atoms=80,
-                                   vasp=OrderedDict(ibrion=1,
-                                                    nsw=100,
-                                                    isif=7,
-                                                    isym=0,
-                                                    ediff=1e-8,
-                                                    kpts=(10, 10, 10),
-                                                    prec='Accurate',
-                                                    encut=500.,
-                                                    pp_version=pp_version(),
-                                                    **xc_settings('pbesol')))
+    SE_bulk_settings = dict(max_atoms=80,
+                            vasp=dict(ibrion=1,
+                                      nsw=100,
+                                      isif=7,
+                                      isym=0,
+                                      ediff=1e-8,
+                                      kpts=(10, 10, 10),
+                                      prec='Accurate',
+                                      encut=500.,
+                                      pp_version=pp_version(),
+                                      **xc_settings('pbesol')))
     return SE_bulk_settings
 
 
@@ -118,28 +129,28 @@ def slab_settings():
     `SlabGenerator` class in pymatgen, and the `get_slab_settings` are passed
     to the `get_slab` method of that class.
     '''
-    slab_settings = OrderedDict(max_miller=2,
-                                max_atoms=80,
-                                vasp=OrderedDict(ibrion=2,
-                                                 nsw=100,
-                                                 isif=0,
-                                                 isym=0,
-                                                 kpts=(4, 4, 1),
-                                                 lreal='Auto',
-                                                 ediffg=-0.03,
-                                                 encut=350.,
-                                                 pp_version=pp_version(),
-                                                 **xc_settings('pbesol')),
-                                slab_generator_settings=OrderedDict(min_slab_size=7.,
-                                                                    min_vacuum_size=20.,
-                                                                    lll_reduce=False,
-                                                                    center_slab=True,
-                                                                    primitive=True,
-                                                                    max_normal_search=1),
-                                get_slab_settings=OrderedDict(tol=0.3,
-                                                              bonds=None,
-                                                              max_broken_bonds=0,
-                                                              symmetrize=False))
+    slab_settings = dict(max_miller=2,
+                         max_atoms=80,
+                         vasp=dict(ibrion=2,
+                                   nsw=100,
+                                   isif=0,
+                                   isym=0,
+                                   kpts=(4, 4, 1),
+                                   lreal='Auto',
+                                   ediffg=-0.03,
+                                   encut=350.,
+                                   pp_version=pp_version(),
+                                   **xc_settings('pbesol')),
+                         slab_generator_settings=dict(min_slab_size=7.,
+                                                      min_vacuum_size=20.,
+                                                      lll_reduce=False,
+                                                      center_slab=True,
+                                                      primitive=True,
+                                                      max_normal_search=1),
+                         get_slab_settings=dict(tol=0.3,
+                                                bonds=None,
+                                                max_broken_bonds=0,
+                                                symmetrize=False))
     return slab_settings
 
 
@@ -149,19 +160,19 @@ def adslab_settings():
     subsequent DFT settings. `mix_xy` is the minimum with of the slab
     (Angstroms) before we enumerate adsorption sites on it.
     '''
-    adslab_settings = OrderedDict(min_xy=4.5,
-                                  rotation=OrderedDict(phi=0., theta=0., psi=0.),
-                                  vasp=OrderedDict(ibrion=2,
-                                                   nsw=200,
-                                                   isif=0,
-                                                   isym=0,
-                                                   kpts=(4, 4, 1),
-                                                   lreal='Auto',
-                                                   ediffg=-0.03,
-                                                   symprec=1e-10,
-                                                   encut=350.,
-                                                   pp_version=pp_version(),
-                                                   **xc_settings()))
+    adslab_settings = dict(min_xy=4.5,
+                           rotation=dict(phi=0., theta=0., psi=0.),
+                           vasp=dict(ibrion=2,
+                                     nsw=200,
+                                     isif=0,
+                                     isym=0,
+                                     kpts=(4, 4, 1),
+                                     lreal='Auto',
+                                     ediffg=-0.03,
+                                     symprec=1e-10,
+                                     encut=350.,
+                                     pp_version=pp_version(),
+                                     **xc_settings()))
     return adslab_settings
 
 
@@ -171,7 +182,41 @@ def adsorbates():
     values are their corresponding `ase.Atoms` objects. When making new entries
     for this dictionary, we recommend "pointing" the adsorbate upwards in the
     z-direction.
+
+    The dictionary itself is built only once (see `_adsorbates`), but we
+    return a deep copy of it so that callers can modify it freely. If you need
+    only one adsorbate, then use `adsorbate` instead, which copies only that
+    one.
     '''
+    return copy.deepcopy(_adsorbates())
+
+
+def adsorbate(name):
+    '''
+    Fetch a copy of a single adsorbate from the `adsorbates` dictionary. This
+    is faster than `adsorbates()[name]` because we copy only the adsorbate
+    you asked for.
+
+    Arg:
+        name    A string for the name of the adsorbate, e.g., 'OH'
+    Returns:
+        atoms   The `ase.Atoms` object of the adsorbate. Raises a `KeyError`
+                if the adsorbate is not defined in `adsorbates`.
+    '''
+    return copy.deepcopy(_adsorbates()[name])
+
+
+@lru_cache(maxsize=1)
+def _adsorbates():
+    '''
+    Builds the dictionary returned by `adsorbates`. This is cached, so do not
+    modify its output directly. Use `adsorbates` or `adsorbate` instead.
+    '''
+    # ASE is only needed here, so we import it here to keep
+    # `gaspy.defaults` cheap to import for everything else
+    from ase import Atoms
+    from ase.constraints import Hookean
+
     adsorbates = {}
     adsorbates[''] = Atoms()
 
@@ -199,8 +244,8 @@ def adsorbates():
     adsorbates['OOH'] = Atoms('OOH', positions=[[0., 0., 0.],
                                                 [1.28, 0., 0.67],
                                                 [1.44, -0.96, 0.81]])
-    adsorbates['OOH'].set_constraint([ase.constraints.Hookean(a1=0, a2=1, rt=1.6, k=10.),   # Bind OO
-                                      ase.constraints.Hookean(a1=1, a2=2, rt=1.37, k=5.)])  # Bind OH
+    adsorbates['OOH'].set_constraint([Hookean(a1=0, a2=1, rt=1.6, k=10.),   # Bind OO
+                                      Hookean(a1=1, a2=2, rt=1.37, k=5.)])  # Bind OH
 
     # For CHO, assumed C binds to surface (index 0), O (index 1), and H(index 2).
     # Trying to apply Hookean so that CH bound doesn't dissociate. Actual structure
@@ -208,8 +253,8 @@ def adsorbates():
     adsorbates['CHO'] = Atoms('CHO', positions=[[0., 0., 1.],
                                                 [-0.94, 0.2, 1.7],      # position of H
                                                 [0.986, 0.6, 1.8]])     # position of O
-    adsorbates['CHO'].set_constraint([ase.constraints.Hookean(a1=0, a2=1, rt=1.59, k=5.),   # Bind CH, initially used k=7, lowered to 5
-                                      ase.constraints.Hookean(a1=0, a2=2, rt=1.79, k=5.)])  # Bind CO
+    adsorbates['CHO'].set_constraint([Hookean(a1=0, a2=1, rt=1.59, k=5.),   # Bind CH, initially used k=7, lowered to 5
+                                      Hookean(a1=0, a2=2, rt=1.79, k=5.)])  # Bind CO
 
     return adsorbates
 
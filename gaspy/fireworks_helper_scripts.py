@@ -6,9 +6,8 @@ and interact with FireWorks.
 __authors__ = ['Zachary W. Ulissi', 'Kevin Tran']
 __emails__ = ['zulissi@andrew.cmu.edu', 'ktran@andrew.cmu.edu']
 
-import os
 import warnings
-import uuid
+from io import BytesIO
 from datetime import datetime
 import getpass
 import pandas as pd
@@ -175,17 +174,8 @@ def encode_atoms_to_trajhex(atoms):
     Output:
         hex_    A hex-encoded string object of the trajectory of the atoms object
     '''
-    # Make the trajectory
-    fname = read_rc('temp_directory') + str(uuid.uuid4()) + '.traj'
-    atoms.write(fname)
-
-    # Encode the trajectory
-    with open(fname, 'rb') as fhandle:
-        hex_ = fhandle.read().hex()
-
-    # Clean up
-    os.remove(fname)
-    return hex_
+    # This is the same encoding that the `vasp_functions` use, so we just use theirs
+    return vasp_functions.atoms_to_hex(atoms)
 
 
 def decode_trajhex_to_atoms(hex_, index=-1):
@@ -203,16 +193,9 @@ def decode_trajhex_to_atoms(hex_, index=-1):
     Output:
         atoms   The decoded ase.Atoms object
     '''
-    # Make the trajectory from the hex
-    fname = read_rc('temp_directory') + str(uuid.uuid4()) + '.traj'
-    with open(fname, 'wb') as fhandle:
-        fhandle.write(bytes.fromhex(hex_))
-
-    # Open up the atoms from the trajectory
-    atoms = ase.io.read(fname, index=index)
-
-    # Clean up
-    os.remove(fname)
+    # Read the atoms straight from the decoded trajectory in memory
+    buffer = BytesIO(bytes.fromhex(hex_))
+    atoms = ase.io.read(buffer, index=index, format='traj')
     return atoms
 
 def submit_fwork(fwork, _testing=False):
@@ -13,12 +13,13 @@ __authors__ = ['John Kitchin', 'Kevin Tran']
 __email__ = 'ktran@andrew.cmu.edu'
 
 import os
-from collections import OrderedDict
+from functools import lru_cache
+from collections import Counter
 import datetime
 import json
 import spglib
 import numpy as np
-from ase import Atoms, Atom
+from ase import Atoms
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.io.jsonio import encode
 from ase.constraints import dict2constraint
@@ -45,18 +46,20 @@ def make_doc_from_atoms(atoms, **kwargs):
             kwargs      Other key-value pairs will be generated
                         according to the user-supplied kwargs
     '''
-    doc = OrderedDict()
+    doc = {}
 
-    atoms_dict = OrderedDict(_make_atoms_dict(atoms))
-    calc_dict = _make_calculator_dict(atoms)
-    results_dict = _make_results_dict(atoms)
+    calculator = atoms.get_calculator()
+    atoms_dict = _make_atoms_dict(atoms)
+    calc_dict = _make_calculator_dict(calculator)
+    results_dict = _make_results_dict(atoms, calculator)
     doc.update({'atoms': atoms_dict})
     doc.update({'calc': calc_dict})
     doc.update({'results': results_dict})
 
     doc['user'] = os.getenv('USER')
-    doc['ctime'] = datetime.datetime.utcnow()
-    doc['mtime'] = datetime.datetime.utcnow()
+    now = datetime.datetime.utcnow()
+    doc['ctime'] = now
+    doc['mtime'] = now
 
     doc.update(kwargs)
 
@@ -72,50 +75,51 @@ def _make_atoms_dict(atoms):
     Returns:
         atoms_dict  A dictionary with various atoms information stored
     '''
+    # Pull the per-atom information out as whole arrays instead of going
+    # through each `ase.Atom` one at a time, which is much slower for big
+    # structures. `tolist` also gives us json-friendly types for free.
+    symbols = atoms.get_chemical_symbols()
+    positions = atoms.get_positions().tolist()
+    tags = atoms.get_tags().tolist()
+    charges = atoms.get_initial_charges().tolist()
+    momenta = atoms.get_momenta().tolist()
+
     # If the atoms object is relaxed, then get the magnetic moments from the
     # calculator. We do this because magnetic moments of individual atoms
     # within a structure are mutable and actually change when the atom is
     # pulled from the structure (even inside a list comprehension).
     try:
-        magmoms = atoms.get_magnetic_moments()
-        atoms_dict = OrderedDict(atoms=[{'symbol': atom.symbol,
-                                         'position': json.loads(encode(atom.position)),
-                                         'tag': atom.tag,
-                                         'index': atom.index,
-                                         'charge': atom.charge,
-                                         'momentum': json.loads(encode(atom.momentum)),
-                                         'magmom': magmoms[i]}
-                                        for i, atom in enumerate(atoms)],
-                                 cell=atoms.cell,
-                                 pbc=atoms.pbc,
-                                 info=atoms.info,
-                                 constraints=[c.todict() for c in atoms.constraints])
-
-    # If the atoms object is unrelaxed, then get the magnetic moment from the
-    # individual atom
+        magmoms = atoms.get_magnetic_moments().tolist()
+    # If the atoms object is unrelaxed, then get the initial magnetic moments
+    # that were set on the atoms
     except RuntimeError:
-        atoms_dict = OrderedDict(atoms=[{'symbol': atom.symbol,
-                                         'position': json.loads(encode(atom.position)),
-                                         'tag': atom.tag,
-                                         'index': atom.index,
-                                         'charge': atom.charge,
-                                         'momentum': json.loads(encode(atom.momentum)),
-                                         'magmom': atom.magmom}
-                                        for atom in atoms],
-                                 cell=atoms.cell,
-                                 pbc=atoms.pbc,
-                                 info=atoms.info,
-                                 constraints=[c.todict() for c in atoms.constraints])
+        magmoms = atoms.get_initial_magnetic_moments().tolist()
+
+    atoms_dict = dict(atoms=[{'symbol': symbols[i],
+                              'position': positions[i],
+                              'tag': tags[i],
+                              'index': i,
+                              'charge': charges[i],
+                              'momentum': momenta[i],
+                              'magmom': magmoms[i]}
+                             for i in range(len(atoms))],
+                      cell=atoms.cell,
+                      pbc=atoms.pbc,
+                      info=atoms.info,
+                      constraints=[c.todict() for c in atoms.constraints])
 
     # Redundant information for search convenience.
     atoms_dict['natoms'] = len(atoms)
-    cell = atoms.get_cell()
     atoms_dict['mass'] = sum(atoms.get_masses())
-    syms = atoms.get_chemical_symbols()
-    atoms_dict['spacegroup'] = spglib.get_spacegroup(make_spglib_cell_from_atoms(atoms))
-    atoms_dict['chemical_symbols'] = list(set(syms))
-    atoms_dict['symbol_counts'] = {sym: syms.count(sym) for sym in syms}
-    if cell is not None and np.linalg.det(cell) > 0:
+    lattice, scaled_positions, numbers = make_spglib_cell_from_atoms(atoms)
+    atoms_dict['spacegroup'] = _get_spacegroup(lattice.tobytes(),
+                                               scaled_positions.tobytes(),
+                                               numbers.tobytes())
+    symbol_counts = Counter(symbols)
+    atoms_dict['chemical_symbols'] = list(symbol_counts)
+    atoms_dict['symbol_counts'] = dict(symbol_counts)
+    # The lattice is the transposed cell, which has the same determinant
+    if np.linalg.det(lattice) > 0:
         atoms_dict['volume'] = atoms.get_volume()
 
     return json.loads(encode(atoms_dict))
@@ -132,26 +136,50 @@ def make_spglib_cell_from_atoms(atoms):
     Returns:
         cell    A 3-tuple that `spglib` can use to perform various operations
     '''
-    lattice = np.array(atoms.get_cell().T, dtype='double', order='C')
-    positions = np.array(atoms.get_scaled_positions(),
-                         dtype='double', order='C')
-    numbers = np.array(atoms.get_atomic_numbers(), dtype='intc')
+    # `ascontiguousarray` and `astype(copy=False)` only copy when they need
+    # to, e.g., for the transposed cell
+    lattice = np.ascontiguousarray(atoms.get_cell().T, dtype='double')
+    positions = np.ascontiguousarray(atoms.get_scaled_positions(), dtype='double')
+    numbers = atoms.get_atomic_numbers().astype('intc', copy=False)
     cell = (lattice, positions, numbers)
     return cell
 
 
-def _make_calculator_dict(atoms):
+@lru_cache(maxsize=4096)
+def _get_spacegroup(lattice_bytes, positions_bytes, numbers_bytes):
+    '''
+    A cached wrapper for `spglib.get_spacegroup`. We tend to make documents
+    for the same structures over and over again, so there is no need to have
+    spglib figure out the same spacegroup each time.
+
+    Args:
+        lattice_bytes   The `bytes` of the lattice array made by
+                        `make_spglib_cell_from_atoms`
+        positions_bytes The `bytes` of the positions array made by
+                        `make_spglib_cell_from_atoms`
+        numbers_bytes   The `bytes` of the atomic numbers array made by
+                        `make_spglib_cell_from_atoms`
+    Returns:
+        spacegroup  A string of the spacegroup, e.g., 'Fm-3m (225)'
+    '''
+    lattice = np.frombuffer(lattice_bytes, dtype='double').reshape(3, 3)
+    positions = np.frombuffer(positions_bytes, dtype='double').reshape(-1, 3)
+    numbers = np.frombuffer(numbers_bytes, dtype='intc')
+    return spglib.get_spacegroup((lattice, positions, numbers))
+
+
+def _make_calculator_dict(calculator):
     '''
     Create a dictionary from an ase.Atoms' object's `calculator` attribute
 
     Arg:
-        atoms   ase.Atoms object
+        calculator  The calculator attached to an ase.Atoms object, i.e.,
+                    the output of `atoms.get_calculator()`
     Returns:
         calc_dict   A dictionary with various calculator information stored.
                     Returns an empty dictionary if there is no calculator.
     '''
-    calc_dict = OrderedDict()
-    calculator = atoms.get_calculator()
+    calc_dict = {}
 
     if calculator:
         try:
@@ -174,32 +202,42 @@ def _make_calculator_dict(atoms):
     return calc_dict
 
 
-def _make_results_dict(atoms):
+def _make_results_dict(atoms, calculator):
     '''
     Create a dictionary from an ase.Atoms' object's `calculator` attribute
 
-    Arg:
-        atoms   ase.Atoms object
+    Args:
+        atoms       ase.Atoms object
+        calculator  The calculator attached to `atoms`, i.e., the output of
+                    `atoms.get_calculator()`
     Returns:
         results_dict    A dictionary with various calculator information stored.
                         Returns an empty dictionary if there is no calculator.
     '''
-    results_dict = OrderedDict()
-    calculator = atoms.get_calculator()
+    results_dict = {}
 
     # Results. This may duplicate information in the calculator,
     # but we have no control on what the calculator does.
     if calculator:
 
-        if not calculator.calculation_required(atoms, ['energy']):
+        # This is what `calculation_required` does, but we check the state of
+        # the atoms only once for both the energy and the forces
+        up_to_date = not calculator.check_state(atoms)
+
+        if up_to_date and 'energy' in calculator.results:
             results_dict['energy'] = atoms.get_potential_energy(apply_constraint=False)
 
-        if not calculator.calculation_required(atoms, ['forces']):
+        if up_to_date and 'forces' in calculator.results:
             forces = atoms.get_forces(apply_constraint=False)
             results_dict['forces'] = forces.tolist()
 
-            # fmax will be the max force component w/ constraints applied
-            results_dict['fmax'] = max(np.abs(atoms.get_forces().flatten()))
+            # fmax will be the max force component w/ constraints applied. We
+            # apply the constraints to a copy of the forces we already have
+            # instead of asking the calculator for them again.
+            constrained_forces = forces.copy()
+            for constraint in atoms.constraints:
+                constraint.adjust_forces(atoms, constrained_forces)
+            results_dict['fmax'] = float(np.abs(constrained_forces).max())
 
     return results_dict
 
@@ -216,13 +254,15 @@ def make_atoms_from_doc(doc):
     Returns:
         atoms   ase.Atoms object with an ase.SinglePointCalculator attached
     '''
-    atoms = Atoms([Atom(atom['symbol'],
-                        atom['position'],
-                        tag=atom['tag'],
-                        momentum=atom['momentum'],
-                        magmom=atom['magmom'],
-                        charge=atom['charge'])
-                   for atom in doc['atoms']['atoms']],
+    # Gather each per-atom property into its own array so that we can make
+    # the whole `ase.Atoms` object at once instead of one `ase.Atom` at a time
+    atom_dicts = doc['atoms']['atoms']
+    atoms = Atoms(symbols=[atom['symbol'] for atom in atom_dicts],
+                  positions=np.array([atom['position'] for atom in atom_dicts]).reshape(-1, 3),
+                  tags=[atom['tag'] for atom in atom_dicts],
+                  momenta=np.array([atom['momentum'] for atom in atom_dicts]).reshape(-1, 3),
+                  magmoms=[atom['magmom'] for atom in atom_dicts],
+                  charges=[atom['charge'] for atom in atom_dicts],
                   cell=doc['atoms']['cell']['array'],
                   pbc=doc['atoms']['pbc'],
                   info=doc['atoms']['info'],
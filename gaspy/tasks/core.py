@@ -168,7 +168,7 @@ def save_task_output(task, output):
     '''
     with task.output().temporary_path() as task.temp_output_path:
         with open(task.temp_output_path, 'wb') as file_handle:
-            pickle.dump(output, file_handle)
+            pickle.dump(output, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def get_task_output(task):
@@ -8,6 +8,7 @@ __email__ = 'ktran@andrew.cmu.edu'
 
 # flake8: noqa
 
+from multiprocessing import Process
 from .catalog import update_catalog_collection
 from .atoms import update_atoms_collection
 from .adsorption import update_adsorption_collection
@@ -15,6 +16,34 @@ from .surfaces import update_surface_energy_collection
 
 
 def update_all_collections(n_processes=1):
+    '''
+    This function will update our `atoms` collection first, because both the
+    `adsorption` and `surface_energy` collections are made from it. Those two
+    do not depend on each other though, so we update them at the same time.
+
+    Args:
+        n_processes     An integer indicating how many processes each
+                        collection update may use. Note that the `adsorption`
+                        and `surface_energy` updates run together, so they
+                        may use up to twice this many in total.
+    '''
     update_atoms_collection(n_processes=n_processes)
-    update_adsorption_collection(n_processes=n_processes)
-    update_surface_energy_collection(n_processes=n_processes)
+
+    # We use processes instead of threads because Luigi needs to be in the
+    # main thread to set up its signal handlers
+    update_functions = [update_adsorption_collection,
+                        update_surface_energy_collection]
+    processes = [Process(target=update_function,
+                         kwargs={'n_processes': n_processes})
+                 for update_function in update_functions]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    failed_updates = [update_function.__name__
+                      for update_function, process in zip(update_functions, processes)
+                      if process.exitcode != 0]
+    if failed_updates:
+        raise RuntimeError('The following collection updates failed:  %s'
+                           % ', '.join(failed_updates))
@@ -167,7 +167,7 @@ class CalculateAdsorbateEnergy(luigi.Task):
 
         # Fetch the adsorbate from our dictionary. If it's not there, yell
         try:
-            adsorbate = defaults.adsorbates()[self.adsorbate_name]
+            adsorbate = defaults.adsorbate(self.adsorbate_name)
         except KeyError as error:
             raise type(error)('You are trying to calculate the adsorbate energy '
                               'of an undefined adsorbate, %s. Please define the '
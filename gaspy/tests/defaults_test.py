@@ -0,0 +1,88 @@
+''' Tests for the `defaults` submodule '''
+
+__author__ = 'Kevin Tran'
+__email__ = 'ktran@andrew.cmu.edu'
+
+# Things we're testing
+from ..defaults import (xc_settings,
+                        adsorbates,
+                        adsorbate,
+                        _adsorbates)
+
+# Things we need to do the tests
+import pytest
+import numpy.testing as npt
+
+
+def test_xc_settings_are_copies():
+    '''
+    `xc_settings` is cached, so make sure that modifying what it gives us does
+    not modify what it gives everyone else.
+    '''
+    settings = xc_settings('rpbe')
+    settings['gga'] = 'PE'
+    settings['foo'] = 'bar'
+
+    assert xc_settings('rpbe') == {'gga': 'RP', 'pp': 'PBE'}
+
+
+@pytest.mark.parametrize('adsorbate', ['OOH', 'CHO'])
+def test_adsorbates_are_copies(adsorbate):
+    '''
+    `adsorbates` is cached, so make sure that modifying what it gives us does
+    not modify what it gives everyone else.
+    '''
+    atoms = adsorbates()[adsorbate]
+    expected_positions = atoms.get_positions()
+    expected_constraints = [constraint.todict() for constraint in atoms.constraints]
+
+    # Modify the positions, the constraints, and the dictionary itself
+    ads_dict = adsorbates()
+    atoms = ads_dict[adsorbate]
+    atoms.positions += 1.
+    for constraint in atoms.constraints:
+        constraint.threshold += 1.
+        constraint.spring += 1.
+    ads_dict[adsorbate] = None
+
+    atoms = adsorbates()[adsorbate]
+    npt.assert_allclose(atoms.get_positions(), expected_positions)
+    assert [constraint.todict() for constraint in atoms.constraints] == expected_constraints
+
+
+def test_adsorbates_are_cached():
+    ''' Make sure that repeated lookups do not rebuild the adsorbates '''
+    adsorbates()
+    hits = _adsorbates.cache_info().hits
+    adsorbates()
+    adsorbate('OH')
+    assert _adsorbates.cache_info().hits == hits + 2
+
+
+@pytest.mark.parametrize('name', ['OOH', 'CHO'])
+def test_adsorbate(name):
+    '''
+    `adsorbate` should give us the same thing as `adsorbates`, and modifying
+    what it gives us should not modify what it gives everyone else.
+    '''
+    expected_atoms = adsorbates()[name]
+    expected_constraints = [constraint.todict() for constraint in expected_atoms.constraints]
+
+    atoms = adsorbate(name)
+    assert atoms == expected_atoms
+    assert [constraint.todict() for constraint in atoms.constraints] == expected_constraints
+
+    # Modify the positions and the constraints
+    atoms.positions += 1.
+    for constraint in atoms.constraints:
+        constraint.threshold += 1.
+        constraint.spring += 1.
+
+    atoms = adsorbate(name)
+    npt.assert_allclose(atoms.get_positions(), expected_atoms.get_positions())
+    assert [constraint.todict() for constraint in atoms.constraints] == expected_constraints
+
+
+def test_adsorbate_undefined():
+    with pytest.raises(KeyError):
+        adsorbate('foo')
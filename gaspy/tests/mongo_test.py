@@ -42,8 +42,8 @@ def test_make_doc_from_atoms_concatenation(bulk_atoms_name):
     del doc['mtime']
 
     atoms_dict = _make_atoms_dict(atoms)
-    calculator_dict = _make_calculator_dict(atoms)
-    results_dict = _make_results_dict(atoms)
+    calculator_dict = _make_calculator_dict(atoms.get_calculator())
+    results_dict = _make_results_dict(atoms, atoms.get_calculator())
     expected = OrderedDict(atoms=atoms_dict,
                            calc=calculator_dict,
                            results=results_dict)
@@ -124,7 +124,7 @@ def test_make_spglib_cell_from_atoms():
 def test_to_create_calculator_dict(bulk_atoms_name):
     atoms = test_cases.get_bulk_atoms(bulk_atoms_name)
     atoms = test_cases.relax_atoms(atoms)
-    calculator_dict = _make_calculator_dict(atoms)
+    calculator_dict = _make_calculator_dict(atoms.get_calculator())
 
     file_name = REGRESSION_BASELINES_LOCATION + 'calculator_dict_for_' + bulk_atoms_name.split('.')[0] + '.pkl'
     with open(file_name, 'wb') as file_handle:
@@ -140,7 +140,7 @@ def test__make_calculator_dict(bulk_atoms_name):
     '''
     atoms = test_cases.get_bulk_atoms(bulk_atoms_name)
     atoms = test_cases.relax_atoms(atoms)
-    calculator_dict = _make_calculator_dict(atoms)
+    calculator_dict = _make_calculator_dict(atoms.get_calculator())
 
     file_name = REGRESSION_BASELINES_LOCATION + 'calculator_dict_for_' + bulk_atoms_name.split('.')[0] + '.pkl'
     with open(file_name, 'rb') as file_handle:
@@ -153,7 +153,7 @@ def test__make_calculator_dict(bulk_atoms_name):
 def test_to_create_results_dict(bulk_atoms_name):
     atoms = test_cases.get_bulk_atoms(bulk_atoms_name)
     atoms = test_cases.relax_atoms(atoms)
-    results_dict = _make_results_dict(atoms)
+    results_dict = _make_results_dict(atoms, atoms.get_calculator())
 
     file_name = REGRESSION_BASELINES_LOCATION + 'results_dict_for_' + bulk_atoms_name.split('.')[0] + '.pkl'
     with open(file_name, 'wb') as file_handle:
@@ -169,7 +169,7 @@ def test__make_results_dict(bulk_atoms_name):
     '''
     atoms = test_cases.get_bulk_atoms(bulk_atoms_name)
     atoms = test_cases.relax_atoms(atoms)
-    results_dict = _make_results_dict(atoms)
+    results_dict = _make_results_dict(atoms, atoms.get_calculator())
 
     file_name = REGRESSION_BASELINES_LOCATION + 'results_dict_for_' + bulk_atoms_name.split('.')[0] + '.pkl'
     with open(file_name, 'rb') as file_handle:
@@ -1,5 +1,5 @@
 import os
-import uuid
+from io import BytesIO
 import numpy as np
 from ase.io import read
 from ase.io.trajectory import TrajectoryWriter
@@ -11,8 +11,12 @@ from ase.calculators.singlepoint import SinglePointCalculator as SPC
 # Need to handle setting the pseudopotential directory, probably in the submission
 # config if it stays constant? (vasp_qadapter.yaml)
 
+# The ASE constraints that VASP can handle on its own
+VASP_COMPATIBLE_CONSTRAINTS = frozenset(['FixAtoms'])
 
-def runVasp(fname_in, fname_out, vaspflags, npar=4):
+
+def runVasp(fname_in, fname_out, vaspflags, npar=4,
+            keep_wavecar=False, keep_chgcar=False, force_std=False):
     '''
     This function is meant to be sent to each cluster and then used to run our rockets.
     As such, it has algorithms to run differently depending on the cluster that is trying
@@ -23,6 +27,16 @@ def runVasp(fname_in, fname_out, vaspflags, npar=4):
         fname_out
         vaspflags
         npar
+        keep_wavecar    Boolean indicating whether to leave the WAVECAR behind
+                        after the calculation. If a WAVECAR is already here
+                        when we start, then we also restart from it.
+        keep_chgcar     Boolean indicating whether to leave the CHGCAR and CHG
+                        behind after the calculation. If we are restarting
+                        from a WAVECAR and a CHGCAR is already here, then we
+                        also restart from the CHGCAR.
+        force_std       Boolean indicating whether to use the standard VASP
+                        binary even for Gamma-point-only calculations, which
+                        otherwise use the faster Gamma-only binary.
     '''
     fname_in = str(fname_in)
     fname_out = str(fname_out)
@@ -31,18 +45,33 @@ def runVasp(fname_in, fname_out, vaspflags, npar=4):
     atoms = read(str(fname_in))
 
     # Check that the unit vectors obey the right-hand rule, (X x Y points in Z) and if not
-    # Flip the order of X and Y to enforce this so that VASP is happy.
-    if np.dot(np.cross(atoms.cell[0], atoms.cell[1]), atoms.cell[2]) < 0:
+    # Flip the order of X and Y to enforce this so that VASP is happy. The triple product
+    # X x Y . Z is just the determinant of the cell.
+    if np.linalg.det(atoms.cell) < 0:
         atoms.set_cell(atoms.cell[[1, 0, 2], :])
 
-    # If we're on UON rcg 
-    NPROCS = int(os.environ['NCPUS'])
-    queue=os.environ['PBS_QUEUE']
+    # If we're on UON rcg, PBS tells us the processors and queue. Otherwise fall
+    # back to SLURM's processor count (or a single processor) and no queue.
+    env = os.environ
+    NPROCS = int(env.get('NCPUS', env.get('SLURM_NPROCS', 1)))
+    queue = env.get('PBS_QUEUE', '')
     vaspflags['npar'] = 4
-    if 'xeon5' in str(queue):
-        vasp_cmd = 'vasp_std'
+
+    # Calculations with only the Gamma point (e.g., gases) can use the Gamma-only
+    # binary, which is faster and uses less memory. Non-grid kpts (e.g., a
+    # scalar or a dictionary) go to the standard binary.
+    kpts = np.asarray(vaspflags.get('kpts', (1, 1, 1)))
+    gamma_only = kpts.shape == (3,) and (kpts == 1).all()
+    if gamma_only and not force_std:
+        if 'xeon5' in queue:
+            vasp_cmd = 'vasp_gam'
+        else:
+            vasp_cmd = '/home/ajp/bin/vasp_gam_5.4.intelmpi'
     else:
-        vasp_cmd = '/home/ajp/bin/vasp_std_5.4.intelmpi'
+        if 'xeon5' in queue:
+            vasp_cmd = 'vasp_std'
+        else:
+            vasp_cmd = '/home/ajp/bin/vasp_std_5.4.intelmpi'
     mpicall = lambda x, y: 'mpirun -np %i %s' % (x, y)  # noqa: E731
 
     # Set the pseudopotential type by setting 'xc' in Vasp()
@@ -55,14 +84,19 @@ def runVasp(fname_in, fname_out, vaspflags, npar=4):
     # s.environ['VASP_PP_PATH'] = os.environ['VASP_PP_BASE'] + '/' + str(pseudopotential) + '/'
     del vaspflags['pp_version']
 
-    os.environ['VASP_COMMAND'] = mpicall(NPROCS, vasp_cmd)
+    env['VASP_COMMAND'] = mpicall(NPROCS, vasp_cmd)
+
+    # Restart from the wavefunctions (and charge density) that an earlier
+    # calculation left here, which saves VASP quite a few SCF steps
+    if keep_wavecar and os.path.exists('WAVECAR'):
+        vaspflags.setdefault('istart', 1)
+        if keep_chgcar and os.path.exists('CHGCAR'):
+            vaspflags.setdefault('icharg', 1)
 
     # Detect whether or not there are constraints that cannot be handled by VASP
-    allowable_constraints = ['FixAtoms']
-    constraint_not_allowable = [constraint.todict()['name']
-                                not in allowable_constraints
-                                for constraint in atoms.constraints]
-    vasp_incompatible_constraints = np.any(constraint_not_allowable)
+    vasp_incompatible_constraints = any(constraint.todict()['name']
+                                        not in VASP_COMPATIBLE_CONSTRAINTS
+                                        for constraint in atoms.constraints)
 
     # If there are incompatible constraints, we need to switch to an ASE-based optimizer
     if vasp_incompatible_constraints:
@@ -82,25 +116,25 @@ def runVasp(fname_in, fname_out, vaspflags, npar=4):
         # Trigger the calculation
         atoms.get_potential_energy()
 
+        # Parse every ionic step out of vasprun.xml, put the atoms back into
+        # our original order, and attach the energies and forces that were
+        # parsed alongside them. Indexing with `resort` already makes a copy.
         atomslist = []
-        for atoms in read('vasprun.xml', ':'):
-            catoms = atoms.copy()
-            catoms = catoms[calc.resort]
-            catoms.set_calculator(SPC(catoms,
-                                      energy=atoms.get_potential_energy(),
-                                      forces=atoms.get_forces()[calc.resort]))
-            atomslist += [catoms]
-
-        # Get the final trajectory
-        finalimage = atoms
-
-        # Write a traj file for the optimization
-        tj = TrajectoryWriter('all.traj', 'a')
-        for atoms in atomslist:
-            print('writing trajectory file!')
-            print(atoms)
-            tj.write(atoms)
-        tj.close()
+        for image in read('vasprun.xml', ':'):
+            resorted_image = image[calc.resort]
+            resorted_image.set_calculator(SPC(resorted_image,
+                                              energy=image.get_potential_energy(),
+                                              forces=image.get_forces()[calc.resort]))
+            atomslist.append(resorted_image)
+
+        # Get the final image
+        finalimage = atomslist[-1]
+
+        # Write a traj file for the optimization. We append in case an earlier
+        # run in this directory already started one.
+        with TrajectoryWriter('all.traj', 'a') as tj:
+            for image in atomslist:
+                tj.write(image)
 
     # Write the final structure
     finalimage.write(fname_out)
@@ -109,22 +143,30 @@ def runVasp(fname_in, fname_out, vaspflags, npar=4):
     with open('energy.out', 'w') as fhandle:
         fhandle.write(str(finalimage.get_potential_energy()))
 
-    try:
-        os.remove('CHGCAR')
-    except OSError:
-        pass
+    # Clean up the big files, unless we want to keep them for restarts
+    for fname, keep in (('CHGCAR', keep_chgcar),
+                        ('WAVECAR', keep_wavecar),
+                        ('CHG', keep_chgcar)):
+        if not keep:
+            try:
+                os.remove(fname)
+            except OSError:
+                pass
+
+    return str(finalimage), _file_to_hex('all.traj'), finalimage.get_potential_energy()
 
-    try:
-        os.remove('WAVECAR')
-    except OSError:
-        pass
 
-    try:
-        os.remove('CHG')
-    except OSError:
-        pass
+def _file_to_hex(fname):
+    '''
+    Read a file and turn its contents into a hex string, making sure that we
+    close the file afterwards.
 
-    return str(atoms), open('all.traj', 'rb').read().hex(), finalimage.get_potential_energy()
+    Input:
+        fname   The name of the file that you want to hex encode
+    '''
+    with open(fname, 'rb') as fhandle:
+        _hex = fhandle.read().hex()
+    return _hex
 
 
 def atoms_to_hex(atoms):
@@ -134,14 +176,14 @@ def atoms_to_hex(atoms):
     Input:
         atoms   The ase.Atoms object that you want to hex encode
     '''
-    # We need to write the atoms object into a file before encoding it. But we don't
-    # want multiple calls to this function to interfere with each other, so we generate
-    # a random file name via uuid to reduce this risk. Then we delete it.
-    fname = str(uuid.uuid4()) + '.traj'
-    atoms.write(fname)
-    with open(fname) as fhandle:
-        _hex = fhandle.read().hex()
-        os.remove(fname)
+    # Write the trajectory into memory instead of onto the disk. Note that the
+    # writer closes the buffer when we close the writer, so we read the buffer
+    # before that.
+    buffer = BytesIO()
+    writer = TrajectoryWriter(buffer)
+    writer.write(atoms)
+    _hex = buffer.getvalue().hex()
+    writer.close()
     return _hex
 
 def hex_to_file(fname_out, atomHex):